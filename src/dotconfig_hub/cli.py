@@ -1,28 +1,34 @@
 """Command-line interface for dotconfig-hub."""
 
-from datetime import datetime
+import re
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import click
-import yaml
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
-from rich.table import Table
+from rich.text import Text
 
 from .compare import EnvSetComparer
 from .config import Config
 from .project_config import ProjectConfig
 from .project_mapping import ProjectMapping
 from .sync import FileSyncer
+from .utils import load_yaml_file
 
 console = Console()
 
+# Leading "YYYY-MM-DDTHH:MM" of an ISO-8601 timestamp
+_ISO_MINUTE_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
 
-def _load_templates_config(config_file: Path) -> Optional[dict]:
-    """Load and validate templates config.yaml.
+# Above this many rows, plain aligned text is printed instead of a Rich Table
+_PLAIN_TABLE_THRESHOLD = 100
 
-    Returns config dict on success, None on failure (with error printed to console).
+
+def _load_env_set_names(config_file: Path) -> Optional[List[str]]:
+    """Load and validate environment set names from templates config.yaml.
+
+    Returns the set names on success, None on failure (with error printed to console).
     Related: used by setup() and global_config() commands.
     """
     if not config_file.exists():
@@ -35,22 +41,25 @@ def _load_templates_config(config_file: Path) -> Optional[dict]:
         return None
 
     try:
-        with open(config_file, "r", encoding="utf-8") as f:
-            templates_config = yaml.safe_load(f)
-
-        if not templates_config or "environment_sets" not in templates_config:
-            console.print("[red]Error: Invalid config.yaml format[/red]")
-            console.print(
-                "[yellow]The config.yaml should contain 'environment_sets'[/yellow]"
-            )
-            return None
-
-        return templates_config
-
+        templates_config = load_yaml_file(config_file)
     except Exception as e:
         console.print(f"[red]Error reading templates config: {e}[/red]")
         return None
 
+    env_sets = (
+        templates_config.get("environment_sets")
+        if isinstance(templates_config, dict)
+        else None
+    )
+    if not isinstance(env_sets, dict):
+        console.print("[red]Error: Invalid config.yaml format[/red]")
+        console.print(
+            "[yellow]The config.yaml should contain 'environment_sets'[/yellow]"
+        )
+        return None
+
+    return [*env_sets]
+
 
 def _prompt_for_directory(cancel_message: str = "cancelled") -> Optional[Path]:
     """Interactively prompt the user for a valid directory path.
@@ -92,7 +101,8 @@ def _validate_env_sets(env_sets: list, available: list) -> Optional[list]:
         The validated list on success, or None if invalid names were found.
 
     """
-    invalid = [s for s in env_sets if s not in available]
+    valid = frozenset(available)
+    invalid = [s for s in env_sets if s not in valid]
     if invalid:
         console.print(f"[red]Invalid environment sets: {', '.join(invalid)}[/red]")
         console.print(f"[yellow]Available sets: {', '.join(available)}[/yellow]")
@@ -162,11 +172,10 @@ def setup(templates_dir: Path) -> None:
 
     # Validate templates directory and load config
     templates_dir = templates_dir.resolve()
-    templates_config = _load_templates_config(templates_dir / "config.yaml")
-    if templates_config is None:
+    env_sets = _load_env_set_names(templates_dir / "config.yaml")
+    if env_sets is None:
         return
 
-    env_sets = [*templates_config["environment_sets"]]
     console.print(
         f"[green]Found {len(env_sets)} environment sets: {', '.join(env_sets)}[/green]"
     )
@@ -240,11 +249,10 @@ def global_config(templates_dir: Path, env_sets: str) -> None:
 
     # Validate templates directory and load config
     templates_dir = templates_dir.resolve()
-    templates_config = _load_templates_config(templates_dir / "config.yaml")
-    if templates_config is None:
+    available_env_sets = _load_env_set_names(templates_dir / "config.yaml")
+    if available_env_sets is None:
         return
 
-    available_env_sets = [*templates_config["environment_sets"]]
     console.print(
         f"[green]Available environment sets: {', '.join(available_env_sets)}[/green]"
     )
@@ -323,8 +331,7 @@ def init(env_set: str, force: bool) -> None:
         return
 
     templates_config_path = project_config.get_templates_config_path()
-    with open(templates_config_path, "r", encoding="utf-8") as f:
-        templates_config = yaml.safe_load(f)
+    templates_config = load_yaml_file(templates_config_path)
 
     available_sets = [*templates_config["environment_sets"]]
 
@@ -514,8 +521,8 @@ def sync(
 
         # Update project mapping after successful sync
         if not dry_run and any(count > 0 for count in all_results.values()):
+            # add_project() records the sync time; one save per sync run
             project_mapping.add_project(target_directory, active_env_sets)
-            project_mapping.update_last_synced(target_directory)
             project_mapping.save_mapping()
             console.print("\n[dim]Updated project mapping[/dim]")
 
@@ -558,8 +565,7 @@ def list() -> None:
         return
 
     templates_config_path = project_config.get_templates_config_path()
-    with open(templates_config_path, "r", encoding="utf-8") as f:
-        templates_config = yaml.safe_load(f)
+    templates_config = load_yaml_file(templates_config_path)
 
     console.print("\n[bold]Available Environment Sets:[/bold]")
     active_sets = set(project_config.get_active_environment_sets())
@@ -623,7 +629,7 @@ def projects(env_set: str, cleanup: bool) -> None:
         return
 
     if env_set:
-        projects = project_mapping.get_projects_by_environment_set(env_set)
+        projects = [*project_mapping.iter_projects_by_environment_set(env_set)]
         if not projects:
             console.print(
                 f"[yellow]No projects found using environment set '{env_set}'[/yellow]"
@@ -631,43 +637,42 @@ def projects(env_set: str, cleanup: bool) -> None:
             return
         console.print(f"\n[bold]Projects using '{env_set}':[/bold]")
     else:
-        all_projects = project_mapping.get_all_projects()
-        if not all_projects:
+        projects = [*project_mapping.get_all_projects().items()]
+        if not projects:
             console.print("[yellow]No tracked projects found[/yellow]")
             console.print(
                 "[dim]Projects are tracked when you run 'dotconfig-hub init' or 'sync'[/dim]"
             )
             return
 
-        # Convert to list format for consistent display
-        projects = []
-        for path, info in all_projects.items():
-            project_info = info.copy()
-            project_info["path"] = path
-            projects.append(project_info)
+    rows = []
+    for path, info in projects:
+        env_sets = ", ".join(map(str, info.get("environment_sets", [])))
+        last_synced = info.get("last_synced", "Never")
+        # null in JSON, or a datetime carried over from a migrated YAML mapping
+        last_synced = "" if last_synced is None else str(last_synced)
 
-    # Display projects
-    table = Table(title="\nTracked Projects")
-    table.add_column("Project Path", style="cyan")
-    table.add_column("Environment Sets", style="green")
-    table.add_column("Last Synced", style="dim")
+        # Format timestamp as "YYYY-MM-DD HH:MM" by slicing the ISO string
+        if _ISO_MINUTE_RE.match(last_synced):
+            last_synced = f"{last_synced[:10]} {last_synced[11:16]}"
 
-    for project in projects:
-        path = project["path"]
-        env_sets = ", ".join(project.get("environment_sets", []))
-        last_synced = project.get("last_synced", "Never")
+        rows.append((path, env_sets, last_synced))
 
-        # Format timestamp
-        if last_synced != "Never":
-            try:
-                dt = datetime.fromisoformat(last_synced)
-                last_synced = dt.strftime("%Y-%m-%d %H:%M")
-            except (ValueError, TypeError):
-                pass
+    # Display projects
+    headers = ("Project Path", "Environment Sets", "Last Synced")
+    if len(rows) > _PLAIN_TABLE_THRESHOLD:
+        _print_plain_table("Tracked Projects", headers, rows)
+    else:
+        from rich.table import Table
 
-        table.add_row(path, env_sets, last_synced)
+        table = Table(title="\nTracked Projects")
+        table.add_column(headers[0], style="cyan")
+        table.add_column(headers[1], style="green")
+        table.add_column(headers[2], style="dim")
+        for row in rows:
+            table.add_row(*row)
 
-    console.print(table)
+        console.print(table)
 
     # Show usage statistics
     if not env_set:
@@ -774,6 +779,31 @@ def compare(
         console.print("\n[yellow]Compare cancelled by user[/yellow]")
 
 
+def _print_plain_table(
+    title: str, headers: Tuple[str, ...], rows: List[Tuple[str, ...]]
+) -> None:
+    """Print rows as left-aligned columns without Rich table layout.
+
+    Args:
+    ----
+        title: Title printed above the columns
+        headers: Column headers
+        rows: Row values, one string per column
+
+    """
+    widths = [
+        max([len(header), *(len(row[i]) for row in rows)])
+        for i, header in enumerate(headers)
+    ]
+
+    def format_row(cells: Tuple[str, ...]) -> str:
+        return "  ".join(cell.ljust(widths[i]) for i, cell in enumerate(cells)).rstrip()
+
+    lines = [f"\n{title}", format_row(headers), "  ".join("-" * w for w in widths)]
+    lines.extend(format_row(row) for row in rows)
+    console.print("\n".join(lines), markup=False, highlight=False)
+
+
 def _display_results(results: dict, dry_run: bool) -> None:
     """Display sync results in a table.
 
@@ -787,20 +817,37 @@ def _display_results(results: dict, dry_run: bool) -> None:
         console.print("\n[green]No files needed synchronization[/green]")
         return
 
-    # Create results table
-    table = Table(title="\nSync Results" + (" (Dry Run)" if dry_run else ""))
-    table.add_column("Environment/Tool", style="cyan")
-    table.add_column("Files Synced", style="green")
+    title = "Sync Results" + (" (Dry Run)" if dry_run else "")
+
+    if len(results) == 1:
+        # Single environment/tool: one line instead of a table render
+        ((tool, count),) = results.items()
+        console.print(
+            Text.assemble(
+                f"\n{title}: ",
+                (tool, "cyan"),
+                " - ",
+                (str(count), "green"),
+                " file(s) synced",
+            ),
+            highlight=False,
+        )
+    else:
+        # Create results table
+        from rich.table import Table
+
+        table = Table(title="\n" + title, highlight=False)
+        table.add_column("Environment/Tool", style="cyan")
+        table.add_column("Files Synced", style="green")
 
-    total = 0
-    for tool, count in results.items():
-        table.add_row(tool, str(count))
-        total += count
+        # Text cells bypass Rich markup parsing
+        for tool, count in results.items():
+            table.add_row(Text(tool), Text(str(count)))
 
-    if len(results) > 1:
-        table.add_row("[bold]Total[/bold]", f"[bold]{total}[/bold]")
+        total = sum(results.values())
+        table.add_row(Text("Total", style="bold"), Text(str(total), style="bold"))
 
-    console.print(table)
+        console.print(table)
 
     if dry_run:
         console.print("\n[yellow]This was a dry run. No files were modified.[/yellow]")
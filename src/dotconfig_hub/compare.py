@@ -102,7 +102,7 @@ class EnvSetComparer:
             files_a = self.config.get_source_files_relative(tool_name, set_a)
             files_b = self.config.get_source_files_relative(tool_name, set_b)
 
-            all_rel_paths = sorted(set(files_a.keys()) | set(files_b.keys()))
+            all_rel_paths = sorted(files_a.keys() | files_b.keys())
 
             for rel_path in all_rel_paths:
                 # Apply file pattern filter if specified
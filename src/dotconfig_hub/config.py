@@ -6,6 +6,8 @@ from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 import yaml
 
+from .utils import SafeLoader
+
 # Default suffixes excluded from sync.
 # .bak files are auto-created by dotconfig-hub during sync as backups
 # and should not be picked up as sync targets.
@@ -65,7 +67,7 @@ class Config:
             return {"environment_sets": {}}
 
         with open(self.config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {"environment_sets": {}}
+            return yaml.load(f, Loader=SafeLoader) or {"environment_sets": {}}
 
     def _migrate_old_config(self) -> None:
         """Migrate old config format to new environment sets format."""
@@ -174,7 +176,7 @@ class Config:
 
     def get_environment_sets(self) -> List[str]:
         """Get list of configured environment sets."""
-        return list(self.config_data.get("environment_sets", {}).keys())
+        return list(self.config_data.get("environment_sets", {}))
 
     def get_environment_set(self, set_name: str) -> Dict[str, Any]:
         """Get configuration for a specific environment set."""
@@ -192,13 +194,13 @@ class Config:
         """
         if env_set:
             env_config = self.get_environment_set(env_set)
-            return list(env_config.get("tools", {}).keys())
+            return list(env_config.get("tools", {}))
         else:
             # Return all tools from all environment sets
             all_tools = []
             for set_name in self.get_environment_sets():
                 env_config = self.get_environment_set(set_name)
-                all_tools.extend(env_config.get("tools", {}).keys())
+                all_tools.extend(env_config.get("tools", {}))
             return list(set(all_tools))  # Remove duplicates
 
     def get_tool_config(
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
-from .utils import to_home_relative_str
+from .utils import SafeDumper, SafeLoader, load_yaml_file, to_home_relative_str
 
 
 class ProjectConfig:
@@ -24,6 +24,8 @@ class ProjectConfig:
         """
         self.project_dir = project_dir or Path.cwd()
         self.config_path = self.project_dir / self.CONFIG_FILENAME
+        # Memoized lookups, cleared whenever the setters change config_data
+        self._cache: Dict[str, Any] = {}
         self.global_config_data = self._load_global_config()
         self.config_data = self._load_config()
 
@@ -34,7 +36,7 @@ class ProjectConfig:
 
         try:
             with open(self.GLOBAL_CONFIG_PATH, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=SafeLoader) or {}
         except Exception as e:
             # Don't raise error for global config issues, just log and continue
             warnings.warn(f"Error loading global config: {e}", stacklevel=2)
@@ -53,7 +55,7 @@ class ProjectConfig:
         if self.config_path.exists():
             try:
                 with open(self.config_path, "r", encoding="utf-8") as f:
-                    project_config = yaml.safe_load(f) or {}
+                    project_config = yaml.load(f, Loader=SafeLoader) or {}
                     config.update(project_config)
             except Exception as e:
                 msg = f"Error loading project config: {e}"
@@ -73,7 +75,13 @@ class ProjectConfig:
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(self.config_path, "w", encoding="utf-8") as f:
-            yaml.dump(self.config_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                self.config_data,
+                f,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
     def exists(self) -> bool:
         """Check if project config file exists."""
@@ -81,12 +89,18 @@ class ProjectConfig:
 
     def get_templates_source(self) -> Optional[Path]:
         """Get templates source directory."""
+        if "templates_source" in self._cache:
+            return self._cache["templates_source"]
+
+        templates_source = None
         source = self.config_data.get("templates_source")
         if source:
             # Expand user home directory
             expanded = Path(source).expanduser().resolve()
-            return expanded if expanded.exists() else None
-        return None
+            templates_source = expanded if expanded.exists() else None
+
+        self._cache["templates_source"] = templates_source
+        return templates_source
 
     @staticmethod
     def _to_home_relative_str(path: Path) -> str:
@@ -101,6 +115,7 @@ class ProjectConfig:
 
         """
         self.config_data["templates_source"] = self._to_home_relative_str(templates_dir)
+        self._cache.clear()
 
     def get_active_environment_sets(self) -> List[str]:
         """Get list of active environment sets."""
@@ -114,6 +129,7 @@ class ProjectConfig:
 
         """
         self.config_data["active_environment_sets"] = env_sets
+        self._cache.clear()
 
     def add_environment_set(self, env_set: str) -> None:
         """Add an environment set to active list.
@@ -133,20 +149,35 @@ class ProjectConfig:
             Path to templates config.yaml or None if not configured/found
 
         """
+        if "templates_config_path" in self._cache:
+            return self._cache["templates_config_path"]
+
+        config_path = None
         templates_source = self.get_templates_source()
-        if not templates_source:
-            return None
+        if templates_source:
+            config_path = templates_source / "config.yaml"
+            if not config_path.exists():
+                config_path = None
 
-        config_path = templates_source / "config.yaml"
-        return config_path if config_path.exists() else None
+        self._cache["templates_config_path"] = config_path
+        return config_path
 
     def validate_setup(self) -> List[str]:
         """Validate project setup and return list of issues.
 
+        The result is memoized until the configuration is changed through
+        set_templates_source() or set_active_environment_sets().
+
         Returns:
             List of validation error messages
 
         """
+        if "validation_issues" not in self._cache:
+            self._cache["validation_issues"] = self._validate_setup()
+        return [*self._cache["validation_issues"]]
+
+    def _validate_setup(self) -> List[str]:
+        """Run the setup checks behind validate_setup()."""
         issues = []
 
         # Check if templates source is configured
@@ -171,10 +202,9 @@ class ProjectConfig:
         # Check if active environment sets are valid (requires templates config)
         if templates_config:
             try:
-                with open(templates_config, "r", encoding="utf-8") as f:
-                    templates_data = yaml.safe_load(f) or {}
+                templates_data = load_yaml_file(templates_config) or {}
 
-                available_sets = set(templates_data.get("environment_sets", {}).keys())
+                available_sets = set(templates_data.get("environment_sets", {}))
                 active_sets = set(self.get_active_environment_sets())
                 invalid_sets = active_sets - available_sets
 
@@ -235,7 +265,13 @@ class ProjectConfig:
         self.GLOBAL_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
         with open(self.GLOBAL_CONFIG_PATH, "w", encoding="utf-8") as f:
-            yaml.dump(global_config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                global_config,
+                f,
+                Dumper=SafeDumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
 
         # Reload global config data
         self.global_config_data = self._load_global_config()
@@ -1,21 +1,110 @@
 """Project mapping management for tracking which projects use which environment sets."""
 
+import functools
+import json
 import logging
-from datetime import datetime
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 import yaml
 
-from .utils import to_home_relative_str
+from .utils import load_yaml_file, rewrite_home_prefix
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing/serialization
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _now_iso() -> str:
+    """Return the current local time as an ISO-8601 timestamp."""
+    return datetime.fromtimestamp(time.time()).isoformat()
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_to_epoch(value: str) -> Optional[float]:
+    """Convert an ISO-8601 timestamp to epoch seconds, or None if invalid.
+
+    Memoized by the timestamp string, so repeated queries over the same
+    mapping parse each stored timestamp only once.
+    """
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+# Number of parent directories from which cleanup checks them in a thread pool
+_PARALLEL_STAT_MIN = 16
+
+
+def _json_default(obj: object) -> str:
+    """Serialize dates left over from hand-edited YAML mappings."""
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _dump_mapping(data: Dict[str, Any]) -> bytes:
+    """Serialize mapping data as indented JSON with sorted keys."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SORT_KEYS
+            | orjson.OPT_APPEND_NEWLINE,
+        )
+    content = json.dumps(
+        data, indent=2, sort_keys=True, ensure_ascii=False, default=_json_default
+    )
+    return (content + "\n").encode("utf-8")
+
+
+# Home directory as used by to_home_relative_str(), read once per process
+_HOME_DIR = os.fspath(Path.home())
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_path_cached(raw: str) -> str:
+    """Resolve a project path and rewrite a home directory prefix to "~/".
+
+    Memoized so repeated lookups of the same path skip realpath(); callers
+    must bypass the cache for relative paths, which depend on the cwd.
+    Results are interned so they match the mapping's keys by identity.
+    """
+    resolved = os.fspath(Path(raw).expanduser().resolve())
+    return sys.intern(rewrite_home_prefix(resolved, _HOME_DIR))
+
+
+def _has_missing_ancestor(path: str, missing: Set[str]) -> bool:
+    """Check whether any parent directory of path is in the missing set."""
+    if not missing:
+        return False
+    parent = os.path.dirname(path)
+    while parent not in missing:
+        grandparent = os.path.dirname(parent)
+        if grandparent == parent:
+            return False
+        parent = grandparent
+    return True
+
+
 class ProjectMapping:
     """Manages the reverse mapping of projects to environment sets."""
 
-    MAPPING_FILENAME = "project_mapping.yaml"
+    MAPPING_FILENAME = "project_mapping.json"
+    # Mapping file written by dotconfig-hub 0.2.0 and earlier
+    LEGACY_MAPPING_FILENAME = "project_mapping.yaml"
 
     def __init__(self, templates_dir: Path) -> None:
         """Initialize project mapping.
@@ -27,34 +116,149 @@ class ProjectMapping:
         """
         self.templates_dir = templates_dir
         self.mapping_path = self.templates_dir / self.MAPPING_FILENAME
-        self.mapping_data = self._load_mapping()
+        # Set when the mapping changes through this class's methods or is
+        # replaced through mapping_data
+        self._dirty = False
+        # Read from disk on first access to mapping_data
+        self._mapping_data: Optional[Dict[str, Any]] = None
+        # Reverse index: environment set name -> paths of projects using it
+        self._env_index: Dict[str, Set[str]] = defaultdict(set)
+        # Environment set name -> number of projects listing it
+        self._usage: Counter = Counter()
+        # The projects dict the index was built from
+        self._indexed_projects: Optional[Dict[str, Any]] = None
+
+    @property
+    def mapping_data(self) -> Dict[str, Any]:
+        """Mapping contents, loaded from project_mapping.json when first used.
+
+        Assigning mapping_data or replacing ``mapping_data["projects"]`` is
+        picked up by the other methods and by save_mapping(); individual
+        entries should be changed through add_project() and remove_project()
+        so the environment set index stays current.
+        """
+        if self._mapping_data is None:
+            # Loading is not a change, so bypass the setter
+            self._mapping_data = self._load_mapping()
+            self._reindex()
+        return self._mapping_data
+
+    @mapping_data.setter
+    def mapping_data(self, data: Dict[str, Any]) -> None:
+        if "projects" not in data:
+            data["projects"] = {}
+        self._mapping_data = data
+        self._reindex()
+        self._dirty = True
+
+    def _reindex(self) -> None:
+        """Rebuild the environment set index and usage counts."""
+        # Intern stored paths so normalized lookups hit them by identity
+        projects = {
+            sys.intern(project_path): info
+            for project_path, info in self._mapping_data["projects"].items()
+        }
+        self._mapping_data["projects"] = projects
+        self._indexed_projects = projects
+        self._env_index.clear()
+        self._usage.clear()
+        for project_path, info in projects.items():
+            self._index_project(project_path, info)
+
+    def _indexed(self) -> Dict[str, Dict[str, Any]]:
+        """Return the projects dict, reindexing it if it has been replaced."""
+        if self.mapping_data["projects"] is not self._indexed_projects:
+            self._reindex()
+            self._dirty = True
+        return self._mapping_data["projects"]
 
     def _load_mapping(self) -> Dict[str, Any]:
-        """Load project mapping from YAML file."""
-        if not self.mapping_path.exists():
+        """Load project mapping from JSON file."""
+        if not os.path.exists(self.mapping_path):
+            return self._migrate_legacy_mapping()
+
+        try:
+            content = self.mapping_path.read_bytes()
+            if orjson is not None:
+                data = orjson.loads(content) or {}
+            else:
+                data = json.loads(content) or {}
+        except ValueError as e:
+            logger.warning("Error loading project mapping: %s", e)
+            return {"projects": {}}
+
+        # Ensure projects key exists
+        if "projects" not in data:
+            data["projects"] = {}
+        return data
+
+    def _migrate_legacy_mapping(self) -> Dict[str, Any]:
+        """Convert a legacy project_mapping.yaml into project_mapping.json.
+
+        The YAML file is removed once the JSON file has been written.
+
+        Returns
+        -------
+            Migrated mapping data, or an empty mapping if there is none
+
+        """
+        legacy_path = self.templates_dir / self.LEGACY_MAPPING_FILENAME
+        if not legacy_path.exists():
             return {"projects": {}}
 
         try:
-            with open(self.mapping_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-                # Ensure projects key exists
-                if "projects" not in data:
-                    data["projects"] = {}
-                return data
+            data = load_yaml_file(legacy_path) or {}
         except yaml.YAMLError as e:
             logger.warning("Error loading project mapping: %s", e)
             return {"projects": {}}
 
+        if "projects" not in data:
+            data["projects"] = {}
+
+        # Bypass the setter: the caller indexes the returned mapping
+        self._mapping_data = data
+        self._dirty = True
+        try:
+            self.save_mapping()
+            legacy_path.unlink()
+        except OSError as e:
+            logger.warning("Could not migrate %s: %s", legacy_path, e)
+        return data
+
     def save_mapping(self) -> None:
-        """Save current mapping to project_mapping.yaml."""
-        self.mapping_path.parent.mkdir(parents=True, exist_ok=True)
+        """Save current mapping to project_mapping.json.
+
+        Does nothing unless the mapping was changed through this class's
+        methods, or mapping_data or its "projects" dict was replaced; edits
+        made directly to stored entries are not detected. The file is left
+        untouched when its content would not change, and is otherwise
+        replaced atomically.
+        """
+        if self._mapping_data is None:
+            return
+        # Counts a replaced projects dict as a change
+        self._indexed()
+        if not self._dirty:
+            return
 
-        # Sort projects by path for consistent output
-        sorted_projects = dict(sorted(self.mapping_data["projects"].items()))
-        self.mapping_data["projects"] = sorted_projects
+        # Projects are written sorted by path for consistent output
+        content = _dump_mapping(self.mapping_data)
+
+        try:
+            unchanged = self.mapping_path.read_bytes() == content
+        except OSError:
+            unchanged = False
 
-        with open(self.mapping_path, "w", encoding="utf-8") as f:
-            yaml.dump(self.mapping_data, f, default_flow_style=False, sort_keys=False)
+        if not unchanged:
+            self.mapping_path.parent.mkdir(parents=True, exist_ok=True)
+            # Per-process name so concurrent runs never share a temp file
+            tmp_path = self.mapping_path.with_name(
+                f"{self.mapping_path.name}.{os.getpid()}.tmp"
+            )
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, self.mapping_path)
+
+        self._dirty = False
 
     def _normalize_project_path(self, project_path: Path) -> str:
         """Normalize project path for consistent storage.
@@ -65,27 +269,62 @@ class ProjectMapping:
 
         Returns:
         -------
-            Normalized path string
+            Normalized path string (e.g. "~/projects/foo" under home)
 
         """
-        return to_home_relative_str(project_path)
-
-    def add_project(self, project_path: Path, environment_sets: List[str]) -> None:
+        raw = os.fspath(project_path)
+        if os.path.isabs(raw):
+            return _normalize_path_cached(raw)
+        return _normalize_path_cached.__wrapped__(raw)
+
+    def _index_project(self, project_path: str, info: Dict[str, Any]) -> None:
+        """Add a project to the environment set index and usage counts."""
+        for env_set in info.get("environment_sets", ()):
+            self._env_index[env_set].add(project_path)
+            self._usage[env_set] += 1
+
+    def _unindex_project(self, project_path: str, info: Dict[str, Any]) -> None:
+        """Remove a project from the environment set index and usage counts."""
+        for env_set in info.get("environment_sets", ()):
+            self._usage[env_set] -= 1
+            if self._usage[env_set] <= 0:
+                del self._usage[env_set]
+            paths = self._env_index.get(env_set)
+            if paths is not None:
+                paths.discard(project_path)
+                if not paths:
+                    del self._env_index[env_set]
+
+    def add_project(
+        self,
+        project_path: Path,
+        environment_sets: List[str],
+        now_iso: Optional[str] = None,
+    ) -> None:
         """Add or update a project's environment set mapping.
 
         Args:
         ----
             project_path: Path to the project directory
             environment_sets: List of environment set names used by the project
+            now_iso: ISO timestamp to record as last_synced (defaults to now)
 
         """
         normalized_path = self._normalize_project_path(project_path)
-
-        self.mapping_data["projects"][normalized_path] = {
+        entry = {
             "environment_sets": environment_sets,
-            "last_synced": datetime.now().isoformat(),
+            "last_synced": now_iso or _now_iso(),
         }
 
+        projects = self._indexed()
+        current = projects.get(normalized_path)
+        if current != entry:
+            if current is not None:
+                self._unindex_project(normalized_path, current)
+            projects[normalized_path] = entry
+            self._index_project(normalized_path, entry)
+            self._dirty = True
+
     def remove_project(self, project_path: Path) -> None:
         """Remove a project from the mapping.
 
@@ -96,8 +335,10 @@ class ProjectMapping:
         """
         normalized_path = self._normalize_project_path(project_path)
 
-        if normalized_path in self.mapping_data["projects"]:
-            del self.mapping_data["projects"][normalized_path]
+        info = self._indexed().pop(normalized_path, None)
+        if info is not None:
+            self._unindex_project(normalized_path, info)
+            self._dirty = True
 
     def get_project_info(self, project_path: Path) -> Optional[Dict[str, Any]]:
         """Get information about a specific project.
@@ -108,12 +349,35 @@ class ProjectMapping:
 
         Returns:
         -------
-            Project info dict or None if not found
+            Stored project info dict, or None if not found. Change it through
+            add_project() rather than editing it in place.
 
         """
         normalized_path = self._normalize_project_path(project_path)
         return self.mapping_data["projects"].get(normalized_path)
 
+    def iter_projects_by_environment_set(
+        self, env_set: str
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over projects using a specific environment set.
+
+        Projects are looked up through the reverse index and yielded sorted
+        by path. Unlike get_projects_by_environment_set(), the stored info
+        dicts are yielded as-is; change them through add_project().
+
+        Args:
+        ----
+            env_set: Environment set name
+
+        Yields:
+        ------
+            (project_path, project_info) tuples
+
+        """
+        projects = self._indexed()
+        for project_path in sorted(self._env_index.get(env_set, ())):
+            yield project_path, projects[project_path]
+
     def get_projects_by_environment_set(self, env_set: str) -> List[Dict[str, Any]]:
         """Get all projects using a specific environment set.
 
@@ -126,22 +390,17 @@ class ProjectMapping:
             List of project info dicts with 'path' key added
 
         """
-        projects = []
-
-        for project_path, info in self.mapping_data["projects"].items():
-            if env_set in info.get("environment_sets", []):
-                project_info = info.copy()
-                project_info["path"] = project_path
-                projects.append(project_info)
-
-        return projects
+        return [
+            {**info, "path": project_path}
+            for project_path, info in self.iter_projects_by_environment_set(env_set)
+        ]
 
     def get_all_projects(self) -> Dict[str, Dict[str, Any]]:
         """Get all tracked projects.
 
         Returns
         -------
-            Dictionary mapping project paths to their info
+            Dictionary mapping project paths to their stored info dicts
 
         """
         return self.mapping_data["projects"].copy()
@@ -154,28 +413,32 @@ class ProjectMapping:
             Dictionary mapping environment set names to usage counts
 
         """
-        usage: Dict[str, int] = {}
-
-        for info in self.mapping_data["projects"].values():
-            for env_set in info.get("environment_sets", []):
-                usage[env_set] = usage.get(env_set, 0) + 1
-
-        return usage
-
-    def update_last_synced(self, project_path: Path) -> None:
+        # Loads and indexes the file on first use
+        if not self._indexed():
+            return {}
+        return dict(self._usage)
+
+    def update_last_synced(
+        self, project_path: Path, now_iso: Optional[str] = None
+    ) -> None:
         """Update the last_synced timestamp for a project.
 
         Args:
         ----
             project_path: Path to the project directory
+            now_iso: ISO timestamp to record (defaults to now)
 
         """
         normalized_path = self._normalize_project_path(project_path)
 
-        if normalized_path in self.mapping_data["projects"]:
-            self.mapping_data["projects"][normalized_path][
-                "last_synced"
-            ] = datetime.now().isoformat()
+        info = self.mapping_data["projects"].get(normalized_path)
+        if info is None:
+            return
+
+        last_synced = now_iso or _now_iso()
+        if info.get("last_synced") != last_synced:
+            info["last_synced"] = last_synced
+            self._dirty = True
 
     def cleanup_missing_projects(self) -> List[str]:
         """Remove projects that no longer exist from the mapping.
@@ -185,15 +448,58 @@ class ProjectMapping:
             List of removed project paths
 
         """
-        removed = []
-
-        for project_path in list(self.mapping_data["projects"].keys()):
+        # Group projects by parent directory so siblings share one scandir()
+        projects = self._indexed()
+        groups: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for project_path in sorted(projects):
             # Expand ~ to home directory
-            expanded_path = Path(project_path).expanduser()
+            expanded_path = os.path.expanduser(project_path)
+            groups[os.path.dirname(expanded_path)].append((project_path, expanded_path))
 
-            if not expanded_path.exists():
-                del self.mapping_data["projects"][project_path]
-                removed.append(project_path)
+        # Expanded paths already known to be missing. Parents sort before
+        # their children, so nested projects can skip the filesystem check.
+        missing_dirs: Set[str] = set()
+
+        def find_missing(parent: str, members: List[Tuple[str, str]]) -> List[str]:
+            if _has_missing_ancestor(members[0][1], missing_dirs):
+                return [project_path for project_path, _ in members]
+
+            listed: Optional[Set[str]] = None
+            if len(members) > 1:
+                try:
+                    with os.scandir(parent) as entries:
+                        # Symlinks may dangle; confirm those with a stat()
+                        listed = {e.name for e in entries if not e.is_symlink()}
+                except FileNotFoundError:
+                    missing_dirs.add(parent)
+                    return [project_path for project_path, _ in members]
+                except OSError:
+                    pass
+
+            missing = []
+            for project_path, expanded_path in members:
+                if listed is not None and os.path.basename(expanded_path) in listed:
+                    continue
+                # Not listed (or no listing): confirm, e.g. case-insensitive FS
+                if not os.path.exists(expanded_path):
+                    missing_dirs.add(expanded_path)
+                    missing.append(project_path)
+            return missing
+
+        if len(groups) >= _PARALLEL_STAT_MIN:
+            # Overlap filesystem latency, e.g. on network filesystems
+            with ThreadPoolExecutor(max_workers=min(32, len(groups))) as executor:
+                results = list(executor.map(find_missing, groups, groups.values()))
+        else:
+            results = [find_missing(*group) for group in groups.items()]
+
+        removed = sorted(chain.from_iterable(results))
+        for project_path in removed:
+            info = projects.pop(project_path)
+            self._unindex_project(project_path, info)
+
+        if removed:
+            self._dirty = True
 
         return removed
 
@@ -209,24 +515,15 @@ class ProjectMapping:
             List of project info dicts with 'path' key added
 
         """
-        cutoff = datetime.now().timestamp() - (hours * 3600)
+        cutoff = time.time() - hours * 3600
         old_projects: List[Dict[str, Any]] = []
 
         for project_path, info in self.mapping_data["projects"].items():
-            last_synced_str = info.get("last_synced")
+            last_synced = info.get("last_synced")
 
             # Treat missing or unparseable timestamps as "needs sync"
-            needs_sync = True
-            if last_synced_str:
-                try:
-                    last_synced = datetime.fromisoformat(last_synced_str)
-                    needs_sync = last_synced.timestamp() < cutoff
-                except (ValueError, TypeError):
-                    pass
-
-            if needs_sync:
-                project_info = info.copy()
-                project_info["path"] = project_path
-                old_projects.append(project_info)
+            epoch = _iso_to_epoch(last_synced) if isinstance(last_synced, str) else None
+            if epoch is None or epoch < cutoff:
+                old_projects.append({**info, "path": project_path})
 
         return old_projects
@@ -373,7 +373,7 @@ class FileSyncer:
 
             choice = Prompt.ask(
                 "Select [p/h/s/d/c]",
-                choices=[key for key in choices.keys()],
+                choices=list(choices),
                 default="s",
             ).lower()
 
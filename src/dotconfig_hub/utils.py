@@ -1,6 +1,31 @@
 """Shared utility functions for dotconfig-hub."""
 
+import hashlib
+import os
+import pickle
 from pathlib import Path
+from typing import Any, Dict, Optional
+
+import yaml
+
+# Prefer the libyaml-backed C loader/dumper; fall back to the pure-Python
+# implementations when PyYAML was built without libyaml.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def rewrite_home_prefix(resolved: str, home: str) -> str:
+    """Rewrite a resolved path under home to its tilde-prefixed form.
+
+    The home directory itself becomes "~/.", as Path.relative_to() gives.
+    Paths outside home are returned unchanged.
+    """
+    if resolved == home:
+        return "~/."
+    prefix = os.path.join(home, "")
+    if resolved.startswith(prefix):
+        return "~/" + resolved[len(prefix) :]
+    return resolved
 
 
 def to_home_relative_str(path: Path) -> str:
@@ -10,13 +35,68 @@ def to_home_relative_str(path: Path) -> str:
     tilde-prefixed string (e.g. "~/projects/foo").  Otherwise returns
     the path as-is in string form.
 
-    Used by ProjectConfig and ProjectMapping to store portable paths.
+    Used by ProjectConfig to store portable paths; ProjectMapping applies
+    the same rewrite_home_prefix() to its keys.
+    """
+    abs_path = os.fspath(path.resolve())
+    try:
+        home = os.fspath(Path.home())
+    except (RuntimeError, OSError):
+        return abs_path
+    return rewrite_home_prefix(abs_path, home)
+
+
+def _yaml_cache_file(path: Path) -> Path:
+    """Return the parse-cache location for a YAML file.
+
+    Cache entries live under $XDG_CACHE_HOME/dotconfig-hub (default
+    ~/.cache/dotconfig-hub) so the hub repository itself stays clean.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha256(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return Path(cache_home) / "dotconfig-hub" / f"{digest}.pkl"
+
+
+def load_yaml_file(path: Path) -> Optional[Dict[str, Any]]:
+    """Load a YAML file, reusing a pickled parse while its content is unchanged.
+
+    The pickle is keyed by a SHA-256 digest of the file's bytes, so edits
+    are picked up even when they keep the size and mtime. Cache read/write
+    failures never affect the result.
+
+    Args:
+        path: YAML file to load
+
+    Returns:
+        Parsed YAML document
+
     """
-    abs_path = path.resolve()
+    content = path.read_bytes()
+    key = hashlib.sha256(content).digest()
+
+    cache_file: Optional[Path] = None
+    try:
+        cache_file = _yaml_cache_file(path)
+        with open(cache_file, "rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        # Any unreadable, corrupt or foreign cache entry is treated as a miss
+        pass
+
+    # Parse from bytes so the C loader decodes UTF-8 itself
+    data = yaml.load(content, Loader=SafeLoader)
+
+    if cache_file is None:
+        return data
     try:
-        home = Path.home()
-        if abs_path.is_relative_to(home):
-            return "~/" + str(abs_path.relative_to(home))
-    except (ValueError, OSError):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
         pass
-    return str(abs_path)
+
+    return data
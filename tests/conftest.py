@@ -0,0 +1,20 @@
+"""Shared pytest fixtures."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_home(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path]:
+    """Keep the YAML parse cache out of the user's real ~/.cache.
+
+    Session-scoped so tests that need no files of their own do not pay for
+    a tmp_path; cache entries are keyed by file path and content, so they
+    cannot leak between tests.
+    """
+    cache_dir = tmp_path_factory.mktemp("xdg-cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+        yield cache_dir
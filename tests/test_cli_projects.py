@@ -0,0 +1,66 @@
+"""Tests for dotconfig-hub CLI projects command."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from dotconfig_hub.cli import projects
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Create a Click test runner."""
+    return CliRunner()
+
+
+def _run_projects(runner: CliRunner, templates_dir: Path, mapping: dict) -> str:
+    """Write a project mapping and run the projects command against it."""
+    (templates_dir / "project_mapping.json").write_text(
+        json.dumps(mapping), encoding="utf-8"
+    )
+    mock_config = MagicMock()
+    mock_config.validate_setup.return_value = []
+    mock_config.get_templates_source.return_value = templates_dir
+
+    with patch("dotconfig_hub.cli.ProjectConfig", return_value=mock_config):
+        result = runner.invoke(projects)
+
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def test_plain_table_with_null_last_synced(runner: CliRunner, tmp_path: Path) -> None:
+    """Test the plain-text listing handles projects synced at an unknown time."""
+    mapping = {
+        "projects": {
+            f"/project{i:03d}": {"environment_sets": ["env_a"], "last_synced": None}
+            for i in range(101)
+        }
+    }
+
+    output = _run_projects(runner, tmp_path, mapping)
+
+    rows = [line.split() for line in output.splitlines()]
+    assert ["/project000", "env_a"] in rows
+    assert ["/project100", "env_a"] in rows
+
+
+def test_table_formats_last_synced(runner: CliRunner, tmp_path: Path) -> None:
+    """Test timestamps are shown to the minute and missing ones as Never."""
+    mapping = {
+        "projects": {
+            "/synced": {
+                "environment_sets": ["env_a"],
+                "last_synced": "2024-01-15T10:30:45",
+            },
+            "/never": {"environment_sets": ["env_b"]},
+        }
+    }
+
+    output = _run_projects(runner, tmp_path, mapping)
+
+    assert "2024-01-15 10:30" in output
+    assert "Never" in output
@@ -10,7 +10,7 @@ import pytest
 import yaml
 from click.testing import CliRunner
 
-from dotconfig_hub.cli import setup
+from dotconfig_hub.cli import _load_env_set_names, setup
 
 
 @pytest.fixture
@@ -394,3 +394,47 @@ class TestSetupCommandOverride:
         # Should NOT call set_templates_source or save_config when cancelled
         mock_project_config.set_templates_source.assert_not_called()
         mock_project_config.save_config.assert_not_called()
+
+
+class TestLoadEnvSetNames:
+    """Test reading environment set names from templates config.yaml."""
+
+    def _write(self, tmp_path: Path, content: str) -> Path:
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(content, encoding="utf-8")
+        return config_file
+
+    def test_env_sets_not_first_key(self, tmp_path: Path) -> None:
+        """Test names are found after other top-level keys."""
+        config_file = self._write(
+            tmp_path,
+            "version: 1\n"
+            "defaults:\n  tools: [a, b]\n"
+            "environment_sets:\n"
+            "  set_a:\n    tools:\n      vscode: {files: [x]}\n"
+            "  set_b:\n    description: B\n",
+        )
+
+        assert _load_env_set_names(config_file) == ["set_a", "set_b"]
+
+    def test_malformed_yaml_is_rejected(self, tmp_path: Path) -> None:
+        """Test a parse error after environment_sets is still reported."""
+        config_file = self._write(
+            tmp_path, "environment_sets:\n  set_a: {}\ntrailing: [unparsed\n"
+        )
+
+        assert _load_env_set_names(config_file) is None
+
+    def test_missing_env_sets(self, tmp_path: Path) -> None:
+        """Test None is returned when environment_sets is absent or not a mapping."""
+        assert _load_env_set_names(self._write(tmp_path, "tools: {}\n")) is None
+        assert (
+            _load_env_set_names(self._write(tmp_path, "environment_sets: []\n")) is None
+        )
+        assert _load_env_set_names(self._write(tmp_path, "- a\n- b\n")) is None
+
+    def test_names_keep_yaml_types(self, tmp_path: Path) -> None:
+        """Test set names are returned as parsed, matching ProjectConfig checks."""
+        config_file = self._write(tmp_path, "environment_sets:\n  1: {}\n  b: {}\n")
+
+        assert _load_env_set_names(config_file) == [1, "b"]
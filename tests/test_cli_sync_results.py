@@ -0,0 +1,35 @@
+"""Tests for the sync results summary printed by the CLI."""
+
+import pytest
+
+from dotconfig_hub.cli import _display_results
+
+
+def test_single_result_printed_as_one_line(capsys: pytest.CaptureFixture) -> None:
+    """Test that one synced tool is summarized on a single line."""
+    _display_results({"python_dev/vscode": 3}, dry_run=False)
+
+    output = capsys.readouterr().out
+    assert "Sync Results: python_dev/vscode - 3 file(s) synced" in output
+    assert "Total" not in output
+
+
+def test_multiple_results_printed_as_table(capsys: pytest.CaptureFixture) -> None:
+    """Test that several tools are listed in a table with a total row."""
+    _display_results({"python_dev/vscode": 3, "web_dev/[bold]x[/bold]": 2}, False)
+
+    output = capsys.readouterr().out
+    cells = [line.replace("│", " ").split() for line in output.splitlines()]
+    assert ["python_dev/vscode", "3"] in cells
+    # Tool names are shown literally, not interpreted as Rich markup
+    assert ["web_dev/[bold]x[/bold]", "2"] in cells
+    assert ["Total", "5"] in cells
+
+
+def test_dry_run_title(capsys: pytest.CaptureFixture) -> None:
+    """Test that dry runs are labelled in the summary."""
+    _display_results({"python_dev/vscode": 1}, dry_run=True)
+
+    assert "Sync Results (Dry Run): python_dev/vscode - 1 file(s) synced" in (
+        capsys.readouterr().out
+    )
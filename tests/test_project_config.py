@@ -0,0 +1,90 @@
+"""Tests for ProjectConfig lookups and their memoization."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dotconfig_hub import project_config as project_config_module
+from dotconfig_hub.project_config import ProjectConfig
+
+
+def _make_templates_dir(path: Path, env_sets: list) -> Path:
+    """Create a templates directory whose config.yaml lists env_sets."""
+    path.mkdir()
+    (path / "config.yaml").write_text(
+        yaml.dump({"environment_sets": {name: {} for name in env_sets}}),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.fixture
+def project_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ProjectConfig:
+    """Create a ProjectConfig set up against a valid templates directory."""
+    monkeypatch.setattr(
+        ProjectConfig, "GLOBAL_CONFIG_PATH", tmp_path / "no-global.yaml"
+    )
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+
+    config = ProjectConfig(project_dir)
+    config.set_templates_source(
+        _make_templates_dir(tmp_path / "templates", ["python_dev", "web_dev"])
+    )
+    config.set_active_environment_sets(["python_dev"])
+    return config
+
+
+def test_validate_setup_reads_templates_config_once(
+    project_config: ProjectConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a repeated validate_setup() reuses the first result."""
+    reads = []
+    load_yaml_file = project_config_module.load_yaml_file
+
+    def counting_load(path: Path) -> dict:
+        reads.append(path)
+        return load_yaml_file(path)
+
+    monkeypatch.setattr(project_config_module, "load_yaml_file", counting_load)
+
+    assert project_config.validate_setup() == []
+    assert project_config.validate_setup() == []
+    assert len(reads) == 1
+
+
+def test_add_environment_set_invalidates_validation(
+    project_config: ProjectConfig,
+) -> None:
+    """Test that adding an unknown set is reported by the next validation."""
+    assert project_config.validate_setup() == []
+
+    project_config.add_environment_set("missing_set")
+
+    assert project_config.validate_setup() == ["Invalid environment sets: missing_set"]
+
+
+def test_set_templates_source_updates_config_path(
+    project_config: ProjectConfig, tmp_path: Path
+) -> None:
+    """Test that changing the templates source changes the config path."""
+    first = project_config.get_templates_config_path()
+    other = _make_templates_dir(tmp_path / "other", ["python_dev"])
+
+    project_config.set_templates_source(other)
+
+    assert first == (tmp_path / "templates" / "config.yaml").resolve()
+    assert project_config.get_templates_config_path() == other.resolve() / "config.yaml"
+    assert project_config.get_templates_source() == other.resolve()
+
+
+def test_validate_setup_returns_copy(project_config: ProjectConfig) -> None:
+    """Test that modifying the returned issues does not affect later calls."""
+    project_config.add_environment_set("missing_set")
+    issues = project_config.validate_setup()
+
+    issues.append("extra")
+    issues.remove("Invalid environment sets: missing_set")
+
+    assert project_config.validate_setup() == ["Invalid environment sets: missing_set"]
@@ -1,20 +1,33 @@
 """Tests for project mapping functionality."""
 
+import json
+import os
+import shutil
 import tempfile
-from collections.abc import Generator
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
 from dotconfig_hub.project_mapping import ProjectMapping
+from dotconfig_hub.utils import to_home_relative_str
+
+
+@pytest.fixture(scope="session")
+def shared_templates_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one templates directory for the whole test session."""
+    return tmp_path_factory.mktemp("templates")
 
 
 @pytest.fixture
-def temp_templates_dir() -> Generator[Path]:
-    """Create a temporary templates directory."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_templates_dir(shared_templates_dir: Path) -> Path:
+    """Provide the shared templates directory, emptied for each test."""
+    for entry in shared_templates_dir.iterdir():
+        if entry.is_dir() and not entry.is_symlink():
+            shutil.rmtree(entry)
+        else:
+            entry.unlink()
+    return shared_templates_dir
 
 
 def test_project_mapping_initialization(temp_templates_dir: Path) -> None:
@@ -22,7 +35,7 @@ def test_project_mapping_initialization(temp_templates_dir: Path) -> None:
     mapping = ProjectMapping(temp_templates_dir)
 
     assert mapping.templates_dir == temp_templates_dir
-    assert mapping.mapping_path == temp_templates_dir / "project_mapping.yaml"
+    assert mapping.mapping_path == temp_templates_dir / "project_mapping.json"
     assert mapping.mapping_data == {"projects": {}}
 
 
@@ -88,6 +101,44 @@ def test_get_projects_by_environment_set(temp_templates_dir: Path) -> None:
     assert len(projects) == 0
 
 
+def test_iter_projects_by_environment_set(temp_templates_dir: Path) -> None:
+    """Test iterating projects by environment set without copying info."""
+    mapping = ProjectMapping(temp_templates_dir)
+
+    mapping.add_project(Path("/project1"), ["env_a", "env_b"])
+    mapping.add_project(Path("/project2"), ["env_b"])
+
+    pairs = list(mapping.iter_projects_by_environment_set("env_b"))
+    assert [path for path, _ in pairs] == ["/project1", "/project2"]
+
+    # Stored info is yielded directly, without an added 'path' key
+    assert pairs[0][1] is mapping.get_project_info(Path("/project1"))
+    assert "path" not in pairs[0][1]
+
+
+def test_environment_set_index_follows_updates(temp_templates_dir: Path) -> None:
+    """Test that environment set lookups reflect re-added and removed projects."""
+    mapping = ProjectMapping(temp_templates_dir)
+
+    mapping.add_project(Path("/project1"), ["env_a"])
+    mapping.add_project(Path("/project2"), ["env_a"])
+    mapping.add_project(Path("/project1"), ["env_b"])
+    mapping.remove_project(Path("/project2"))
+
+    assert mapping.get_projects_by_environment_set("env_a") == []
+    assert mapping.get_environment_set_usage() == {"env_b": 1}
+    assert [p["path"] for p in mapping.get_projects_by_environment_set("env_b")] == [
+        "/project1"
+    ]
+
+    # Index is rebuilt from the saved file
+    mapping.save_mapping()
+    reloaded = ProjectMapping(temp_templates_dir)
+    assert [p["path"] for p in reloaded.get_projects_by_environment_set("env_b")] == [
+        "/project1"
+    ]
+
+
 def test_get_environment_set_usage(temp_templates_dir: Path) -> None:
     """Test getting environment set usage statistics."""
     mapping = ProjectMapping(temp_templates_dir)
@@ -104,8 +155,16 @@ def test_get_environment_set_usage(temp_templates_dir: Path) -> None:
     assert usage["env_c"] == 1
 
 
-def test_update_last_synced(temp_templates_dir: Path) -> None:
+def test_update_last_synced(
+    temp_templates_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test updating last_synced timestamp."""
+    # Fake clock advancing one second per call, so no real delay is needed
+    ticks = iter(range(1_700_000_000, 1_800_000_000))
+    monkeypatch.setattr(
+        "dotconfig_hub.project_mapping._now_iso",
+        lambda: datetime.fromtimestamp(next(ticks)).isoformat(),
+    )
     mapping = ProjectMapping(temp_templates_dir)
 
     project_path = Path("/my-project")
@@ -116,9 +175,6 @@ def test_update_last_synced(temp_templates_dir: Path) -> None:
     timestamp1 = info1["last_synced"]
 
     # Update timestamp
-    import time
-
-    time.sleep(0.1)  # Small delay to ensure different timestamp
     mapping.update_last_synced(project_path)
 
     # Check updated timestamp
@@ -148,6 +204,149 @@ def test_save_and_load_mapping(temp_templates_dir: Path) -> None:
     assert mapping2.get_project_info(Path("/project2")) is not None
 
 
+def test_environment_set_index_follows_replaced_projects(
+    temp_templates_dir: Path,
+) -> None:
+    """Test that replacing mapping_data["projects"] rebuilds the index."""
+    mapping = ProjectMapping(temp_templates_dir)
+    mapping.add_project(Path("/project1"), ["env_a"])
+
+    mapping.mapping_data["projects"] = {
+        "/project2": {"environment_sets": ["env_b"]},
+    }
+
+    assert mapping.get_projects_by_environment_set("env_a") == []
+    assert [p["path"] for p in mapping.get_projects_by_environment_set("env_b")] == [
+        "/project2"
+    ]
+    assert mapping.get_environment_set_usage() == {"env_b": 1}
+
+
+def test_save_mapping_skips_unchanged(
+    temp_templates_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that save_mapping does not rewrite the file when nothing changed."""
+    mapping1 = ProjectMapping(temp_templates_dir)
+    mapping1.save_mapping()
+    assert not mapping1.mapping_path.exists()
+
+    mapping1.add_project(Path("/project1"), ["env_a"], now_iso="2024-01-15T10:30:00")
+    mapping1.save_mapping()
+    assert mapping1.mapping_path.exists()
+
+    mtime_ns = mapping1.mapping_path.stat().st_mtime_ns
+    writes = []
+    real_replace = os.replace
+
+    def recording_replace(src: Path, dst: Path) -> None:
+        writes.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr("dotconfig_hub.project_mapping.os.replace", recording_replace)
+
+    # Identical entry: nothing is marked dirty
+    mapping2 = ProjectMapping(temp_templates_dir)
+    mapping2.add_project(Path("/project1"), ["env_a"], now_iso="2024-01-15T10:30:00")
+    mapping2.save_mapping()
+
+    # Changed then reverted: dirty, but the serialized content matches the file
+    mapping2.update_last_synced(Path("/project1"), now_iso="2024-01-16T10:30:00")
+    mapping2.update_last_synced(Path("/project1"), now_iso="2024-01-15T10:30:00")
+    mapping2.save_mapping()
+
+    assert mapping1.mapping_path not in writes
+    assert mapping1.mapping_path.stat().st_mtime_ns == mtime_ns
+
+
+def test_save_mapping_writes_replaced_projects(temp_templates_dir: Path) -> None:
+    """Test that assigning mapping_data["projects"] is saved."""
+    mapping = ProjectMapping(temp_templates_dir)
+    mapping.mapping_data["projects"] = {
+        "/project1": {"environment_sets": ["env_a"]},
+    }
+
+    mapping.save_mapping()
+
+    assert json.loads(mapping.mapping_path.read_text(encoding="utf-8")) == {
+        "projects": {"/project1": {"environment_sets": ["env_a"]}}
+    }
+    assert list(temp_templates_dir.iterdir()) == [mapping.mapping_path]
+
+
+def test_save_mapping_writes_assigned_mapping(temp_templates_dir: Path) -> None:
+    """Test that assigning mapping_data as a whole is saved."""
+    mapping = ProjectMapping(temp_templates_dir)
+    mapping.mapping_data = {"projects": {"/project1": {"environment_sets": ["env_a"]}}}
+
+    mapping.save_mapping()
+
+    assert json.loads(mapping.mapping_path.read_text(encoding="utf-8")) == {
+        "projects": {"/project1": {"environment_sets": ["env_a"]}}
+    }
+    assert mapping.get_environment_set_usage() == {"env_a": 1}
+
+    mapping.mapping_data = {}
+    assert mapping.get_all_projects() == {}
+
+
+def test_loading_mapping_does_not_mark_it_changed(temp_templates_dir: Path) -> None:
+    """Test that reading an existing mapping file does not rewrite it."""
+    mapping_path = temp_templates_dir / "project_mapping.json"
+    mapping_path.write_text('{"projects": {}}', encoding="utf-8")
+
+    mapping = ProjectMapping(temp_templates_dir)
+    assert mapping.get_all_projects() == {}
+    mapping.save_mapping()
+
+    assert mapping_path.read_text(encoding="utf-8") == '{"projects": {}}'
+
+
+def test_legacy_yaml_mapping_is_migrated(temp_templates_dir: Path) -> None:
+    """Test that an existing project_mapping.yaml is converted to JSON."""
+    legacy_path = temp_templates_dir / "project_mapping.yaml"
+    legacy_path.write_text(
+        "projects:\n"
+        "  /project1:\n"
+        "    environment_sets:\n"
+        "    - env_a\n"
+        "    last_synced: '2024-01-15T10:30:00'\n",
+        encoding="utf-8",
+    )
+
+    mapping = ProjectMapping(temp_templates_dir)
+
+    assert [p["path"] for p in mapping.get_projects_by_environment_set("env_a")] == [
+        "/project1"
+    ]
+    assert not legacy_path.exists()
+    assert json.loads(mapping.mapping_path.read_text(encoding="utf-8")) == {
+        "projects": {
+            "/project1": {
+                "environment_sets": ["env_a"],
+                "last_synced": "2024-01-15T10:30:00",
+            }
+        }
+    }
+
+
+def test_mapping_is_loaded_on_first_use(temp_templates_dir: Path) -> None:
+    """Test that the mapping file is only read when its data is needed."""
+    mapping_path = temp_templates_dir / "project_mapping.json"
+    mapping_path.write_text(
+        '{"projects": {"/project1": {"environment_sets": ["env_a"]}}}',
+        encoding="utf-8",
+    )
+
+    mapping = ProjectMapping(temp_templates_dir)
+    mapping_path.write_text(
+        '{"projects": {"/project2": {"environment_sets": ["env_b"]}}}',
+        encoding="utf-8",
+    )
+
+    assert mapping.get_environment_set_usage() == {"env_b": 1}
+    assert list(mapping.get_all_projects()) == ["/project2"]
+
+
 def test_cleanup_missing_projects(temp_templates_dir: Path) -> None:
     """Test cleaning up projects that no longer exist."""
     mapping = ProjectMapping(temp_templates_dir)
@@ -168,6 +367,56 @@ def test_cleanup_missing_projects(temp_templates_dir: Path) -> None:
     assert "/non/existing/path2" in str(removed)
 
 
+def test_cleanup_missing_nested_projects(
+    temp_templates_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that projects under a missing directory are removed without a stat."""
+    mapping = ProjectMapping(temp_templates_dir)
+    mapping.add_project(Path("/non/existing"), ["env_a"])
+    mapping.add_project(Path("/non/existing/child"), ["env_b"])
+
+    checked = []
+
+    def fake_exists(path: str) -> bool:
+        checked.append(path)
+        return False
+
+    monkeypatch.setattr("dotconfig_hub.project_mapping.os.path.exists", fake_exists)
+    removed = mapping.cleanup_missing_projects()
+
+    assert removed == ["/non/existing", "/non/existing/child"]
+    assert checked == ["/non/existing"]
+    assert mapping.get_all_projects() == {}
+
+
+def test_cleanup_lists_shared_parent_once(
+    temp_templates_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that sibling projects are checked with one directory listing."""
+    mapping = ProjectMapping(temp_templates_dir)
+    parent = temp_templates_dir / "workspace"
+    (parent / "a").mkdir(parents=True)
+    (parent / "b").mkdir()
+    for name in ("a", "b", "gone"):
+        mapping.add_project(parent / name, ["env_a"])
+
+    checked = []
+    real_exists = os.path.exists
+
+    def recording_exists(path: str) -> bool:
+        checked.append(path)
+        return real_exists(path)
+
+    monkeypatch.setattr(
+        "dotconfig_hub.project_mapping.os.path.exists", recording_exists
+    )
+    removed = mapping.cleanup_missing_projects()
+
+    assert [Path(p).name for p in removed] == ["gone"]
+    # Only the project missing from the listing needs its own stat()
+    assert [Path(p).name for p in checked] == ["gone"]
+
+
 def test_find_projects_needing_sync(temp_templates_dir: Path) -> None:
     """Test finding projects that need synchronization."""
     mapping = ProjectMapping(temp_templates_dir)
@@ -196,6 +445,44 @@ def test_find_projects_needing_sync(temp_templates_dir: Path) -> None:
     assert "/recent-project" not in paths
 
 
+def test_find_projects_needing_sync_timezone_aware(temp_templates_dir: Path) -> None:
+    """Test that timezone-aware timestamps are still compared correctly."""
+    mapping = ProjectMapping(temp_templates_dir)
+
+    now = datetime.now(timezone.utc)
+    mapping.mapping_data["projects"] = {
+        "/old-utc": {
+            "environment_sets": ["env_a"],
+            "last_synced": (now - timedelta(hours=48)).isoformat(),
+        },
+        "/recent-utc": {
+            "environment_sets": ["env_a"],
+            "last_synced": (now - timedelta(hours=1)).isoformat(),
+        },
+    }
+
+    paths = [p["path"] for p in mapping.find_projects_needing_sync(hours=24)]
+    assert paths == ["/old-utc"]
+
+
+def test_relative_path_normalization_follows_cwd(
+    temp_templates_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that relative paths are not served from the normalization cache."""
+    mapping = ProjectMapping(temp_templates_dir)
+    first = temp_templates_dir / "first"
+    second = temp_templates_dir / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    mapping.add_project(Path("."), ["env_a"])
+    monkeypatch.chdir(second)
+    mapping.add_project(Path("."), ["env_b"])
+
+    assert len(mapping.get_all_projects()) == 2
+
+
 def test_path_normalization_with_home_directory(temp_templates_dir: Path) -> None:
     """Test that paths are normalized correctly with home directory."""
     mapping = ProjectMapping(temp_templates_dir)
@@ -211,3 +498,14 @@ def test_path_normalization_with_home_directory(temp_templates_dir: Path) -> Non
 
     assert len(stored_paths) == 1
     assert stored_paths[0].startswith("~/")
+
+
+def test_home_paths_match_project_config_form(temp_templates_dir: Path) -> None:
+    """Test that mapping keys use the same "~/" form as ProjectConfig."""
+    mapping = ProjectMapping(temp_templates_dir)
+
+    for project_path in (Path.home(), Path.home() / "test-project", Path("/")):
+        mapping.add_project(project_path, ["test_env"])
+        assert mapping.get_project_info(Path(to_home_relative_str(project_path)))
+
+    assert sorted(mapping.get_all_projects()) == ["/", "~/.", "~/test-project"]
@@ -0,0 +1,107 @@
+"""Tests for the pickled YAML parse cache."""
+
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dotconfig_hub.utils import _yaml_cache_file, load_yaml_file
+
+
+def test_load_writes_cache_outside_source_dir(
+    tmp_path: Path, isolated_cache_home: Path
+) -> None:
+    """Test that the first load populates the cache under XDG_CACHE_HOME."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"environment_sets": {"a": {}}}))
+
+    assert load_yaml_file(config_file) == {"environment_sets": {"a": {}}}
+
+    cache_file = _yaml_cache_file(config_file)
+    assert cache_file.exists()
+    assert cache_file.is_relative_to(isolated_cache_home)
+    assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+
+def test_cache_hit_skips_yaml_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an unchanged file is served from the cache."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"environment_sets": {"a": {}}}))
+    load_yaml_file(config_file)
+
+    def fail_load(*args: object, **kwargs: object) -> None:
+        pytest.fail("YAML should not be re-parsed on a cache hit")
+
+    monkeypatch.setattr("dotconfig_hub.utils.yaml.load", fail_load)
+    assert load_yaml_file(config_file) == {"environment_sets": {"a": {}}}
+
+
+def test_cache_invalidated_when_file_changes(tmp_path: Path) -> None:
+    """Test that modifying the source file bypasses the stale cache entry."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"environment_sets": {"a": {}}}))
+    load_yaml_file(config_file)
+
+    config_file.write_text(yaml.dump({"environment_sets": {"b": {}}}))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_yaml_file(config_file) == {"environment_sets": {"b": {}}}
+
+
+def test_corrupt_cache_falls_back_to_yaml(tmp_path: Path) -> None:
+    """Test that an unreadable cache entry is ignored."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"environment_sets": {"a": {}}}))
+
+    cache_file = _yaml_cache_file(config_file)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(b"not a pickle")
+
+    assert load_yaml_file(config_file) == {"environment_sets": {"a": {}}}
+
+
+def test_cache_invalidated_by_same_size_edit(tmp_path: Path) -> None:
+    """Test that an edit keeping size and mtime is not served from the cache."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"environment_sets": {"a": {}}}))
+    stat = config_file.stat()
+    load_yaml_file(config_file)
+
+    config_file.write_text(yaml.dump({"environment_sets": {"b": {}}}))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert config_file.stat().st_size == stat.st_size
+    assert load_yaml_file(config_file) == {"environment_sets": {"b": {}}}
+
+
+def test_wrong_shape_cache_falls_back_to_yaml(tmp_path: Path) -> None:
+    """Test that a valid pickle with unexpected contents is ignored."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"environment_sets": {"a": {}}}))
+
+    cache_file = _yaml_cache_file(config_file)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(pickle.dumps(5))
+
+    assert load_yaml_file(config_file) == {"environment_sets": {"a": {}}}
+
+
+def test_unknown_cache_location_falls_back_to_yaml(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that loading works when no cache directory can be determined."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"environment_sets": {"a": {}}}))
+
+    def no_home() -> Path:
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    monkeypatch.setattr("dotconfig_hub.utils.Path.home", no_home)
+
+    assert load_yaml_file(config_file) == {"environment_sets": {"a": {}}}